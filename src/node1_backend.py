@@ -5,35 +5,365 @@ Handles form submissions and writes user profiles to Google Sheets.
 """
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, field_validator
+from typing import List, Optional, Tuple
+from contextlib import closing
+from dataclasses import dataclass
 from datetime import datetime
-import json
+import asyncio
+import orjson
 import logging
+import mmap
+import os
+import queue
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
 from pathlib import Path
 
+try:
+    import liburing  # Targets the liburing==2026.3.30 API (Ring / Cqe)
+except ImportError:  # Optional, Linux only
+    liburing = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI
-app = FastAPI(title="AI Briefing System - Node 1 Intake")
+app = FastAPI(
+    title="AI Briefing System - Node 1 Intake",
+    default_response_class=ORJSONResponse
+)
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_HHMM_RE = re.compile(r"(?:[01]\d|2[0-3]):[0-5]\d")
+
+# Profile index upsert, shared by the write path and the backfill.
+# Writers queue on the index lock, so give them longer than sqlite's 5s.
+UPSERT_PROFILE_SQL = "INSERT OR REPLACE INTO profiles (email, json) VALUES (?, ?)"
+SQLITE_TIMEOUT = 30.0
+
+
 class UserProfile(BaseModel):
     """User profile schema matching Node 1 specification."""
     version: str
-    email: EmailStr
+    email: str
     name: Optional[str] = None
     briefing_time: str  # HH:MM format
     topics: List[str]
     created_at: str  # ISO-8601 timestamp
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Cheap syntactic email check (no DNS / deliverability lookup)."""
+        if not _EMAIL_RE.fullmatch(v):
+            raise ValueError("Invalid email address")
+        return v
+
+
+# ============================================================================
+# BATCHED FILE WRITES
+# ============================================================================
+
+@dataclass
+class UringOp:
+    """A single write submitted to the IO engine."""
+    fd: int
+    buf: bytes
+    size: int
+    row: Optional[Tuple[str, str]] = None  # (email, json) to index once written
+    future: Optional[asyncio.Future] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class IoUringBatchEngine:
+    """
+    Executes queued writes in batches on a daemon thread.
+
+    Ops that arrive while a batch is in flight are grouped per file
+    descriptor and appended with one write followed by one fsync. On
+    Linux with liburing installed, the write and fsync of a batch go
+    out as a single linked io_uring submission; otherwise plain posix
+    writes are used.
+
+    When an index database is given, the rows carried by a batch are
+    upserted in log order under the same SQLite write lock as the
+    append, so the index never disagrees with the log about which
+    entry came last, even with several worker processes.
+    """
+
+    MAX_BATCH = 1000
+    QUEUE_DEPTH = 8
+
+    def __init__(self, index_db: Optional[Path] = None):
+        self.index_db = index_db
+        self._queue: queue.Queue = queue.Queue()
+        self._ring = None
+
+        if liburing is not None and sys.platform.startswith("linux"):
+            try:
+                self._ring = liburing.Ring()
+                self._cqe = liburing.Cqe()
+                liburing.io_uring_queue_init(self.QUEUE_DEPTH, self._ring)
+                self._self_test()
+                logger.info("io_uring write path enabled")
+            except Exception as e:
+                self._disable_ring(e)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    async def submit(self, op: UringOp) -> int:
+        """Queue an op and wait for its batch to complete."""
+        op.loop = asyncio.get_running_loop()
+        op.future = op.loop.create_future()
+        self._queue.put(op)
+        return await op.future
+
+    def close(self):
+        """Finish queued ops and stop the worker thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+        if self._ring is not None:
+            liburing.io_uring_queue_exit(self._ring)
+            self._ring = None
+
+    def _run(self):
+        running = True
+
+        while running:
+            batch = [self._queue.get()]
+
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in batch:
+                running = False
+                batch = [op for op in batch if op is not None]
+
+            # Never let the thread die: awaiting writers would hang forever
+            try:
+                self._process(batch)
+            except Exception as e:
+                logger.exception(f"IO engine error: {str(e)}")
+                for op in batch:
+                    _resolve(op, None, e)
+
+    def _process(self, batch: List[UringOp]):
+        """Write each fd's ops as one blob and resolve their futures."""
+        by_fd = {}
+        for op in batch:
+            by_fd.setdefault(op.fd, []).append(op)
+
+        for fd, ops in by_fd.items():
+            blob = b''.join(op.buf[:op.size] for op in ops)
+            rows = [op.row for op in ops if op.row is not None]
+            try:
+                if rows and self.index_db is not None:
+                    self._write_indexed(fd, blob, rows)
+                else:
+                    self._write(fd, blob)
+            except Exception as e:
+                for op in ops:
+                    _resolve(op, None, e)
+            else:
+                for op in ops:
+                    _resolve(op, op.size, None)
+
+    def _write_indexed(self, fd: int, blob: bytes, rows: List[Tuple[str, str]]):
+        """
+        Append a blob and upsert its rows while holding the index write lock.
+
+        Only a failed append fails the ops. If the index can't be locked
+        or updated, the append still goes through and the backfill
+        marker is cleared so the next start rebuilds from the log.
+        """
+        try:
+            conn = sqlite3.connect(self.index_db, timeout=SQLITE_TIMEOUT, isolation_level=None)
+        except Exception as e:
+            logger.error(f"Profile index unavailable, will rebuild on restart: {str(e)}")
+            self._write(fd, blob)
+            return
+
+        with closing(conn):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+            except Exception as e:
+                logger.error(f"Profile index locked, will rebuild on restart: {str(e)}")
+                self._write(fd, blob)
+                _mark_backfill_needed(conn)
+                return
+
+            try:
+                self._write(fd, blob)
+            except Exception:
+                _rollback(conn)
+                raise
+
+            try:
+                conn.executemany(UPSERT_PROFILE_SQL, rows)
+                conn.execute("COMMIT")
+            except Exception as e:
+                logger.error(f"Error indexing profiles, will rebuild on restart: {str(e)}")
+                _rollback(conn)
+                _mark_backfill_needed(conn)
+
+    def _write(self, fd: int, blob: bytes):
+        """Write and fsync a blob, dropping to posix if io_uring misbehaves."""
+        if self._ring is None:
+            self._write_posix(fd, blob)
+            return
+
+        try:
+            sqes = self._prep_uring(fd, blob)
+        except Exception as e:
+            # Nothing was submitted, so a posix retry cannot duplicate data
+            self._disable_ring(e)
+            self._write_posix(fd, blob)
+            return
+
+        try:
+            written, synced = self._submit_uring(sqes)
+        except Exception as e:
+            # Outcome unknown; fail this batch rather than risk writing twice
+            self._disable_ring(e)
+            raise
+
+        if written < 0:
+            # The write failed outright, so retrying the whole blob is safe
+            self._disable_ring(OSError(-written, os.strerror(-written)))
+            self._write_posix(fd, blob)
+        elif written < len(blob):
+            # Short write: the linked fsync was cancelled, finish with posix
+            self._write_posix(fd, blob[written:])
+        elif synced < 0:
+            os.fsync(fd)
+
+    def _prep_uring(self, fd: int, blob: bytes) -> int:
+        """Queue a linked write+fsync pair on the ring; returns the SQE count."""
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        if sqe is None:
+            raise RuntimeError("io_uring submission queue is full")
+        # Offset is ignored for O_APPEND descriptors
+        liburing.io_uring_prep_write(sqe, fd, blob, 0)
+        liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        if sqe is None:
+            raise RuntimeError("io_uring submission queue is full")
+        liburing.io_uring_prep_fsync(sqe, fd, 0)
+
+        return 2
+
+    def _submit_uring(self, sqes: int) -> List[int]:
+        """Submit queued SQEs and collect their completion results in order."""
+        liburing.io_uring_submit(self._ring)
+
+        results = []
+        for _ in range(sqes):
+            liburing.io_uring_wait_cqe(self._ring, self._cqe)
+            try:
+                results.append(self._cqe[0].res)
+            except OSError as e:
+                # Reading a negative res raises; keep it as -errno
+                results.append(-e.errno)
+            finally:
+                liburing.io_uring_cq_advance(self._ring, 1)
+
+        return results
+
+    def _self_test(self):
+        """Write and fsync a temp file through the ring and verify it."""
+        payload = b"io_uring self-test\n"
+        path = None
+
+        try:
+            fd, path = tempfile.mkstemp(prefix="node1-uring-")
+            os.close(fd)
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+            try:
+                written, synced = self._submit_uring(self._prep_uring(fd, payload))
+            finally:
+                os.close(fd)
+
+            if written != len(payload) or synced != 0:
+                raise RuntimeError(f"unexpected results: write={written} fsync={synced}")
+            if Path(path).read_bytes() != payload:
+                raise RuntimeError("file contents do not match what was written")
+        finally:
+            if path:
+                os.unlink(path)
+
+    def _disable_ring(self, error: BaseException):
+        """Tear down the ring and use posix writes from now on."""
+        logger.warning(f"io_uring disabled, using posix writes: {str(error)}")
+        ring, self._ring = self._ring, None
+        if ring is None:
+            return
+        try:
+            liburing.io_uring_queue_exit(ring)
+        except Exception:
+            pass
+
+    def _write_posix(self, fd: int, blob: bytes):
+        """Write a blob with os.write and fsync it."""
+        view = memoryview(blob)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+
+
+def _rollback(conn: sqlite3.Connection):
+    """Roll back an open transaction, ignoring a connection already in error."""
+    try:
+        conn.execute("ROLLBACK")
+    except sqlite3.Error:
+        pass
+
+
+def _mark_backfill_needed(conn: sqlite3.Connection):
+    """Clear the backfill marker so the next start replays the JSONL log."""
+    try:
+        conn.execute("DELETE FROM meta WHERE key = 'backfilled'")
+        if conn.in_transaction:
+            conn.commit()
+    except Exception as e:
+        logger.error(f"Error clearing backfill marker: {str(e)}")
+
+
+def _resolve(op: UringOp, result, error: Optional[BaseException]):
+    """Hand an op's outcome back to its event loop from the engine thread."""
+    try:
+        op.loop.call_soon_threadsafe(_set_future, op.future, result, error)
+    except RuntimeError:
+        # The caller's loop has closed; nobody is waiting for this result
+        pass
+
+
+def _set_future(future: asyncio.Future, result, error: Optional[BaseException]):
+    """Resolve a future on its own loop (scheduled by _resolve)."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
 
 # ============================================================================
 # GOOGLE SHEETS INTEGRATION
@@ -47,61 +377,189 @@ class GoogleSheetsWriter:
     - Google Sheets API
     - Composio MCP integration
     - Or direct API calls
+
+    Profiles are appended to a JSONL log (read by Node 2) and upserted
+    into a SQLite table keyed by email for single-profile lookups.
     """
     
+    # Files larger than this are scanned through mmap instead of read whole
+    MMAP_THRESHOLD = 64 * 1024 * 1024
+
     def __init__(self, spreadsheet_id: str = None):
         self.spreadsheet_id = spreadsheet_id
         self.profiles_file = Path("user_profiles.jsonl")
-        
-        # Create file if it doesn't exist
-        if not self.profiles_file.exists():
-            self.profiles_file.touch()
+        self.profiles_db = Path("profiles.db")
+
+        # Long-lived append descriptor (creates the file if it doesn't exist)
+        self._fd = os.open(self.profiles_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._init_db()
+        self._engine = IoUringBatchEngine(index_db=self.profiles_db)
     
-    def write_profile(self, profile: UserProfile) -> bool:
+    async def write_profile(self, profile: UserProfile) -> bool:
         """
         Write user profile to storage.
         
         In production, this would write to Google Sheets.
         For now, we store in JSONL format as a proof-of-concept.
+        Lines are queued and appended in batches; this returns once
+        the batch containing the profile has been flushed to disk.
+
+        The JSONL log is the record of truth: the engine upserts the
+        SQLite index row in the same locked step as the append, and an
+        index failure is repaired by replaying the log on the next start.
         """
         try:
-            # Append to JSONL file
-            with open(self.profiles_file, 'a') as f:
-                f.write(profile.json() + '\n')
-            
-            logger.info(f"Profile written for {profile.email}")
-            return True
+            line = orjson.dumps(profile.model_dump()) + b'\n'
+            await self._engine.submit(UringOp(
+                fd=self._fd, buf=line, size=len(line),
+                row=(profile.email, line[:-1].decode())
+            ))
         
         except Exception as e:
             logger.error(f"Error writing profile: {str(e)}")
             return False
+
+        logger.info(f"Profile written for {profile.email}")
+        return True
+
+    def _init_db(self):
+        """
+        Create the profiles table, backfilling it from the JSONL log.
+
+        The backfill holds the index write lock and re-checks the marker
+        once it has it, so when several workers start together one does
+        the backfill and the rest wait for it and skip.
+        """
+        conn = sqlite3.connect(self.profiles_db, timeout=SQLITE_TIMEOUT, isolation_level=None)
+        with closing(conn):
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS profiles (email TEXT PRIMARY KEY, json TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                done = conn.execute(
+                    "SELECT 1 FROM meta WHERE key = 'backfilled'"
+                ).fetchone()
+
+                if not done:
+                    # Later lines win, matching re-registration semantics. The
+                    # marker commits in the same transaction, so a failed
+                    # backfill is retried on the next start.
+                    conn.executemany(
+                        UPSERT_PROFILE_SQL,
+                        ((p.email, p.model_dump_json()) for p in self.iter_profiles())
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('backfilled', ?)",
+                        (datetime.utcnow().isoformat(),)
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                _rollback(conn)
+                raise
+
+    def get_profile(self, email: str) -> Optional[UserProfile]:
+        """
+        Look up a single profile by email.
+
+        Falls back to scanning the JSONL log (latest entry wins) when
+        the index has no row or cannot be read.
+        """
+        try:
+            with closing(sqlite3.connect(self.profiles_db, timeout=SQLITE_TIMEOUT)) as conn:
+                row = conn.execute(
+                    "SELECT json FROM profiles WHERE email = ?", (email,)
+                ).fetchone()
+
+            if row:
+                return UserProfile.model_validate_json(row[0])
+
+        except Exception as e:
+            logger.error(f"Error reading profile: {str(e)}")
+
+        found = None
+        for profile in self.iter_profiles():
+            if profile.email == email:
+                found = profile
+        return found
+
+    async def close(self):
+        """Drain pending writes and release the file descriptor."""
+        await asyncio.to_thread(self._engine.close)
+        os.close(self._fd)
     
     def get_profiles(self) -> List[UserProfile]:
         """Retrieve all user profiles."""
-        profiles = []
-        
+        return list(self.iter_profiles())
+
+    def iter_profiles(self):
+        """Yield each stored profile, skipping lines that fail validation."""
         try:
-            if self.profiles_file.exists():
-                with open(self.profiles_file, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            profiles.append(UserProfile.parse_raw(line))
-        
-        except Exception as e:
+            if not self.profiles_file.exists():
+                return
+
+            for line in self._iter_lines(self.profiles_file.stat().st_size):
+                if not line.strip():
+                    continue
+                try:
+                    profile = UserProfile.model_validate_json(line)
+                except Exception as e:
+                    logger.error(f"Error reading profile: {str(e)}")
+                    continue
+                yield profile
+
+        except OSError as e:
             logger.error(f"Error reading profiles: {str(e)}")
-        
-        return profiles
 
+    def stream_profiles(self):
+        """Yield each stored profile as an NDJSON line."""
+        for profile in self.iter_profiles():
+            yield orjson.dumps(profile.model_dump()) + b'\n'
+
+    def _iter_lines(self, size: int):
+        """Yield raw JSONL lines, splitting on newlines in C."""
+        if size < self.MMAP_THRESHOLD:
+            yield from self.profiles_file.read_bytes().split(b'\n')
+            return
+
+        with open(self.profiles_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = 0
+                while pos < len(mm):
+                    end = mm.find(b'\n', pos)
+                    if end == -1:
+                        end = len(mm)
+                    yield mm[pos:end]
+                    pos = end + 1
+
+
+# Sheets writer, created at startup so each worker opens its own file and ring
+sheets_writer: Optional[GoogleSheetsWriter] = None
 
-# Initialize sheets writer
-sheets_writer = GoogleSheetsWriter()
+
+@app.on_event("startup")
+async def startup():
+    """Open the profiles file and index, backfilling it if needed."""
+    global sheets_writer
+    sheets_writer = await asyncio.to_thread(GoogleSheetsWriter)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the profiles file on shutdown."""
+    if sheets_writer is not None:
+        await sheets_writer.close()
 
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
 
 @app.get("/")
-async def root():
+def root():
     """Serve the intake form."""
     return FileResponse("src/node1_intake_form.html", media_type="text/html")
 
@@ -119,11 +577,7 @@ async def create_intake(profile: UserProfile):
             raise HTTPException(status_code=400, detail="Email is required")
         
         # Validate briefing time format (HH:MM)
-        try:
-            hour, minute = profile.briefing_time.split(':')
-            if not (0 <= int(hour) < 24 and 0 <= int(minute) < 60):
-                raise ValueError("Invalid time")
-        except:
+        if not _HHMM_RE.fullmatch(profile.briefing_time):
             raise HTTPException(status_code=400, detail="Invalid briefing time format (use HH:MM)")
         
         # Validate topics
@@ -131,7 +585,7 @@ async def create_intake(profile: UserProfile):
             raise HTTPException(status_code=400, detail="At least one topic must be selected")
         
         # Write to sheets
-        success = sheets_writer.write_profile(profile)
+        success = await sheets_writer.write_profile(profile)
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save profile")
@@ -139,7 +593,7 @@ async def create_intake(profile: UserProfile):
         return {
             "status": "success",
             "message": f"Profile created for {profile.email}",
-            "profile": profile.dict()
+            "profile": profile
         }
     
     except HTTPException:
@@ -150,30 +604,41 @@ async def create_intake(profile: UserProfile):
 
 
 @app.get("/api/profiles")
-async def get_profiles():
-    """Get all user profiles (admin endpoint)."""
-    profiles = sheets_writer.get_profiles()
+def get_profiles():
+    """Stream all user profiles as NDJSON (admin endpoint)."""
+    return StreamingResponse(
+        sheets_writer.stream_profiles(),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.get("/api/profiles/{email}")
+async def get_profile(email: str):
+    """Get a single user profile by email (admin endpoint)."""
+    profile = await asyncio.to_thread(sheets_writer.get_profile, email)
+    if not profile:
+        raise HTTPException(status_code=404, detail=f"Profile {email} not found")
+
     return {
         "status": "success",
-        "count": len(profiles),
-        "profiles": [p.dict() for p in profiles]
+        "profile": profile
     }
 
 
 @app.get("/success")
-async def success():
+def success():
     """Success page after form submission."""
     return FileResponse("src/node1_success.html", media_type="text/html")
 
 
 @app.get("/unsubscribe")
-async def unsubscribe_page():
+def unsubscribe_page():
     """Unsubscribe page."""
     return FileResponse("src/node1_unsubscribe.html", media_type="text/html")
 
 
 @app.get("/preferences")
-async def preferences_page():
+def preferences_page():
     """Preferences page."""
     return FileResponse("src/node1_preferences.html", media_type="text/html")
 
@@ -205,6 +670,9 @@ async def update_preferences(data: dict):
     if not topics:
         raise HTTPException(status_code=400, detail="At least one topic is required")
 
+    if not isinstance(briefing_time, str) or not _HHMM_RE.fullmatch(briefing_time):
+        raise HTTPException(status_code=400, detail="Invalid briefing time format (use HH:MM)")
+
     logger.info(f"Preferences update for {email}: {len(topics)} topics, time: {briefing_time}")
 
     # For now, just log it - in production would update database
@@ -212,7 +680,7 @@ async def update_preferences(data: dict):
 
 
 @app.get("/health")
-async def health():
+def health():
     """Health check endpoint."""
     return {
         "status": "ok",
@@ -228,7 +696,7 @@ async def health():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "status": "error",
@@ -241,8 +709,9 @@ async def http_exception_handler(request, exc):
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        app,
+        "node1_backend:app",
         host="0.0.0.0",
         port=8001,
+        workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
         log_level="info"
     )
@@ -5,15 +5,17 @@ Endpoints:
 - POST /generate - Generate and send briefings
 - POST /generate/{email} - Generate for specific user
 - GET /preview/{email} - Preview briefing without sending
+- GET /jobs/{job_id} - Status of a generation job
 - GET /health - Health check
 """
 
 import os
+import uuid
 import asyncio
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 from node2_briefing_generator import (
@@ -30,12 +32,36 @@ from node2_briefing_generator import (
 app = FastAPI(
     title="AI Briefing Generator",
     version="1.0.0",
-    description="Generate personalized AI news briefings"
+    description="Generate personalized AI news briefings",
+    default_response_class=ORJSONResponse
 )
 
 # Store for background job status
 job_status = {"running": False, "last_run": None, "last_result": None}
 
+# Per-job records, keyed by job id (oldest first)
+jobs: Dict[str, dict] = {}
+
+# How many finished job records to keep for /jobs/{job_id}
+MAX_FINISHED_JOBS = 50
+
+# Shared generator, created at startup so HTTP sessions persist across requests
+generator: Optional[BriefingGenerator] = None
+
+
+@app.on_event("startup")
+async def startup():
+    """Create the shared briefing generator."""
+    global generator
+    generator = BriefingGenerator(config)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the shared generator's HTTP sessions."""
+    if generator is not None:
+        await generator.close()
+
 
 class GenerateRequest(BaseModel):
     """Request body for generate endpoint."""
@@ -52,6 +78,13 @@ class GenerateResponse(BaseModel):
     failed: int = 0
 
 
+class JobResponse(BaseModel):
+    """Response when a generation job is accepted."""
+    status: str
+    message: str
+    job_id: str
+
+
 @app.get("/health")
 async def health():
     """Health check."""
@@ -64,36 +97,63 @@ async def health():
     }
 
 
-@app.get("/trigger")
-async def trigger_briefings():
+@app.get("/trigger", status_code=202, response_model=JobResponse)
+async def trigger_briefings(background_tasks: BackgroundTasks):
     """
     Simple GET endpoint for external cron services (cron-job.org, etc).
 
     Set up your cron service to hit:
     https://petra-generator.onrender.com/trigger
     """
-    return await generate_briefings()
+    return await generate_briefings(background_tasks=background_tasks, request=GenerateRequest())
 
 
-@app.post("/generate", response_model=GenerateResponse)
+@app.post("/generate", status_code=202, response_model=JobResponse)
 async def generate_briefings(
-    request: GenerateRequest = GenerateRequest(),
-    background_tasks: BackgroundTasks = None
+    background_tasks: BackgroundTasks,
+    request: GenerateRequest = GenerateRequest()
 ):
     """
-    Generate and send briefings.
+    Start generating and sending briefings in the background.
 
     - If email is provided, generate for that user only
     - If email is None, generate for all users
+
+    Returns a job id immediately; poll /jobs/{job_id} for the result.
     """
     if job_status["running"]:
         raise HTTPException(status_code=409, detail="A job is already running")
 
+    job_id = uuid.uuid4().hex
+    started_at = datetime.utcnow().isoformat() + "Z"
+
+    background_tasks.add_task(_run_job, job_id)
+
+    # Only mark the job running once it is actually scheduled
+    _prune_jobs()
+    jobs[job_id] = {"job_id": job_id, "status": "running", "started_at": started_at}
     job_status["running"] = True
-    job_status["last_run"] = datetime.utcnow().isoformat() + "Z"
+    job_status["last_run"] = started_at
+
+    return JobResponse(
+        status="accepted",
+        message="Briefing generation started",
+        job_id=job_id
+    )
+
+
+def _prune_jobs():
+    """Drop the oldest finished job records beyond MAX_FINISHED_JOBS."""
+    finished = [job_id for job_id, job in jobs.items() if job["status"] != "running"]
+    for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del jobs[job_id]
+
+
+async def _run_job(job_id: str):
+    """Run the briefing workflow and record the outcome for job_id."""
+    job = jobs[job_id]
 
     try:
-        generator = BriefingGenerator(config)
         results = await generator.run()
 
         successful = sum(1 for r in results if r.status == "success")
@@ -105,30 +165,40 @@ async def generate_briefings(
             "failed": failed
         }
 
-        return GenerateResponse(
+        job["status"] = "completed"
+        job["result"] = GenerateResponse(
             status="completed",
             message=f"Generated briefings for {len(results)} users",
             users_processed=len(results),
             successful=successful,
             failed=failed
-        )
+        ).model_dump()
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        job["status"] = "failed"
+        job["error"] = str(e)
     finally:
+        job["finished_at"] = datetime.utcnow().isoformat() + "Z"
         job_status["running"] = False
 
 
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get the status (and result, once finished) of a generation job."""
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    return job
+
+
 @app.get("/preview/{email}", response_class=HTMLResponse)
 async def preview_briefing(email: str):
     """
     Preview a briefing for a specific user without sending email.
     Returns the HTML that would be sent.
     """
-    generator = BriefingGenerator(config)
-
-    # Load profiles and find user
-    profiles = generator.profile_loader.load_profiles()
-    user = next((p for p in profiles if p.email == email), None)
+    # Look up user
+    user = await asyncio.to_thread(generator.profile_loader.get_profile, email)
 
     if not user:
         raise HTTPException(status_code=404, detail=f"User {email} not found")
@@ -136,10 +206,9 @@ async def preview_briefing(email: str):
     # Fetch and process articles
     from datetime import timedelta
     since_date = (datetime.utcnow() - timedelta(hours=48)).strftime("%Y-%m-%d")
-    articles = await generator.article_fetcher.fetch_articles(since_date=since_date)
-    articles = generator.article_fetcher.deduplicate(articles)
-    articles = generator.article_fetcher.filter_recent(articles, hours=48)
-    articles_by_source = generator.article_fetcher.group_by_source(articles)
+    articles_by_source, total_articles = await generator.get_articles_by_source(
+        since_date, hours=48
+    )
 
     # Process with LLM
     processed = await generator.llm_processor.process_all_sites_parallel(
@@ -159,7 +228,7 @@ async def preview_briefing(email: str):
 
     # Generate all sections
     landscape = await generator.llm_processor.generate_landscape(
-        processed_by_source, user.topics, len(articles)
+        processed_by_source, user.topics, total_articles
     )
     top5 = await generator.llm_processor.select_top_5(processed, user.topics)
     deep_dives = await generator.llm_processor.generate_deep_dives(processed, user.topics)
@@ -205,7 +274,6 @@ async def preview_briefing(email: str):
 @app.get("/users")
 async def list_users():
     """List all registered users."""
-    generator = BriefingGenerator(config)
     profiles = generator.profile_loader.load_profiles()
 
     return {
@@ -229,4 +297,11 @@ async def list_users():
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8003))
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    # Job status lives in-process, so default to one worker
+    uvicorn.run(
+        "node2_api:app",
+        host="0.0.0.0",
+        port=port,
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+        log_level="info"
+    )
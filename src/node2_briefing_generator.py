@@ -17,12 +17,15 @@ Can be run standalone or triggered by Enso workflow.
 
 import os
 import json
+import time
+import sqlite3
 import asyncio
 import aiohttp
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from pathlib import Path
+from contextlib import closing
 from dataclasses import dataclass, asdict, field
 from jinja2 import Template
 import smtplib
@@ -65,6 +68,7 @@ class Config:
 
     # Paths
     profiles_path: str = os.getenv("PROFILES_PATH", "user_profiles.jsonl")
+    profiles_db_path: str = os.getenv("PROFILES_DB_PATH", "profiles.db")
     template_path: str = os.getenv("TEMPLATE_PATH", "src/node2_email_template.html")
 
     # Settings
@@ -174,8 +178,9 @@ class BriefingResult:
 class ProfileLoader:
     """Load user profiles from storage."""
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, db_path: Optional[str] = None):
         self.path = Path(path)
+        self.db_path = Path(db_path) if db_path else None
 
     def load_profiles(self) -> List[UserProfile]:
         """Load all user profiles."""
@@ -197,16 +202,63 @@ class ProfileLoader:
         logger.info(f"Loaded {len(profiles)} user profiles")
         return profiles
 
+    def get_profile(self, email: str) -> Optional[UserProfile]:
+        """
+        Load a single profile by email.
+
+        Uses the SQLite index written by Node 1 when available. If the
+        index is missing, unreadable or has no row for the email, falls
+        back to scanning the JSONL file (latest entry wins).
+        """
+        if self.db_path and self.db_path.exists():
+            try:
+                with closing(sqlite3.connect(self.db_path)) as conn:
+                    row = conn.execute(
+                        "SELECT json FROM profiles WHERE email = ?", (email,)
+                    ).fetchone()
+                if row:
+                    return UserProfile(**json.loads(row[0]))
+            except Exception as e:
+                logger.error(f"Error reading profile from {self.db_path}: {e}")
+
+        found = None
+        for profile in self.load_profiles():
+            if profile.email == email:
+                found = profile
+        return found
+
     def filter_by_time(self, profiles: List[UserProfile], target_time: str) -> List[UserProfile]:
         """Filter profiles by briefing time (HH:MM format)."""
         return [p for p in profiles if p.briefing_time == target_time]
 
 
+# ============================================================================
+# SHARED HTTP SESSION
+# ============================================================================
+
+class HTTPClient:
+    """Base for components that reuse one aiohttp session across calls."""
+
+    _session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
 # ============================================================================
 # ARTICLE FETCHER
 # ============================================================================
 
-class ArticleFetcher:
+class ArticleFetcher(HTTPClient):
     """Fetch articles from MCP server."""
 
     def __init__(self, base_url: str):
@@ -221,16 +273,16 @@ class ArticleFetcher:
             params["since"] = since_date
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"MCP server error: {response.status}")
-                        return []
+            session = self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    logger.error(f"MCP server error: {response.status}")
+                    return []
 
-                    data = await response.json()
-                    articles = [Article(**a) for a in data.get("articles", [])]
-                    logger.info(f"Fetched {len(articles)} articles from MCP")
-                    return articles
+                data = await response.json()
+                articles = [Article(**a) for a in data.get("articles", [])]
+                logger.info(f"Fetched {len(articles)} articles from MCP")
+                return articles
 
         except Exception as e:
             logger.error(f"Error fetching articles: {e}")
@@ -281,7 +333,7 @@ class ArticleFetcher:
 # LLM PROCESSOR (New Architecture)
 # ============================================================================
 
-class LLMProcessor:
+class LLMProcessor(HTTPClient):
     """
     Process articles using OpenAI LLM with system prompts.
 
@@ -326,26 +378,26 @@ class LLMProcessor:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error = await response.text()
-                        logger.error(f"LLM API error: {response.status} - {error}")
-                        return None
+            session = self._get_session()
+            async with session.post(url, headers=headers, json=payload) as response:
+                if response.status != 200:
+                    error = await response.text()
+                    logger.error(f"LLM API error: {response.status} - {error}")
+                    return None
 
-                    data = await response.json()
-                    content = data["choices"][0]["message"]["content"]
+                data = await response.json()
+                content = data["choices"][0]["message"]["content"]
 
-                    if not parse_json:
-                        return content.strip()
+                if not parse_json:
+                    return content.strip()
 
-                    # Parse JSON from response
-                    if "```json" in content:
-                        content = content.split("```json")[1].split("```")[0]
-                    elif "```" in content:
-                        content = content.split("```")[1].split("```")[0]
+                # Parse JSON from response
+                if "```json" in content:
+                    content = content.split("```json")[1].split("```")[0]
+                elif "```" in content:
+                    content = content.split("```")[1].split("```")[0]
 
-                    return json.loads(content.strip())
+                return json.loads(content.strip())
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}")
@@ -704,13 +756,62 @@ class BriefingGenerator:
     6. Compose and send email
     """
 
+    # How long a fetched article set is reused by get_articles_by_source
+    ARTICLES_CACHE_TTL = 300
+
     def __init__(self, cfg: Config):
         self.config = cfg
-        self.profile_loader = ProfileLoader(cfg.profiles_path)
+        self.profile_loader = ProfileLoader(cfg.profiles_path, cfg.profiles_db_path)
         self.article_fetcher = ArticleFetcher(cfg.article_service_url)
         self.llm_processor = LLMProcessor(cfg.openai_api_key, cfg.openai_model, cfg.openai_base_url)
         self.email_sender = EmailSender(cfg.resend_api_key, cfg.from_email)
 
+        # (since_date, hours) -> (fetched_at, articles_by_source, total_articles)
+        self._articles_cache: Dict[tuple, tuple] = {}
+        self._articles_lock = asyncio.Lock()
+
+    async def get_articles_by_source(
+        self,
+        since_date: str,
+        hours: int = 48
+    ) -> tuple[Dict[str, List[Article]], int]:
+        """
+        Fetch, deduplicate, filter and group articles.
+
+        Results are cached for ARTICLES_CACHE_TTL seconds per
+        (since_date, hours), and concurrent callers share one fetch.
+
+        Returns:
+            Tuple of (articles grouped by source, total article count).
+        """
+        key = (since_date, hours)
+
+        async with self._articles_lock:
+            cached = self._articles_cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.ARTICLES_CACHE_TTL:
+                return cached[1], cached[2]
+
+            articles = await self.article_fetcher.fetch_articles(since_date=since_date)
+            articles = self.article_fetcher.deduplicate(articles)
+            articles = self.article_fetcher.filter_recent(articles, hours=hours)
+            articles_by_source = self.article_fetcher.group_by_source(articles)
+
+            # Drop expired entries so the cache stays small
+            now = time.monotonic()
+            self._articles_cache = {
+                k: v for k, v in self._articles_cache.items()
+                if now - v[0] < self.ARTICLES_CACHE_TTL
+            }
+            if articles:
+                self._articles_cache[key] = (now, articles_by_source, len(articles))
+
+            return articles_by_source, len(articles)
+
+    async def close(self):
+        """Close HTTP sessions held by the fetcher and LLM processor."""
+        await self.article_fetcher.close()
+        await self.llm_processor.close()
+
     async def generate_briefing_for_user(
         self,
         user: UserProfile,
@@ -931,7 +1032,10 @@ async def main():
         generator.email_sender.send_email = lambda *args, **kwargs: True
 
     # Run workflow
-    results = await generator.run(target_time=args.time)
+    try:
+        results = await generator.run(target_time=args.time)
+    finally:
+        await generator.close()
 
     # Print summary
     print("\n" + "=" * 60)
@@ -4,11 +4,23 @@ System prompts for Node 2 briefing generation.
 All prompts accept user_topics to personalize the analysis.
 """
 
-def format_topics(topics: list[str]) -> str:
-    """Format topics list for prompt injection."""
+import functools
+
+import orjson
+
+
+@functools.lru_cache(maxsize=1024)
+def format_topics(topics: tuple[str, ...]) -> str:
+    """Format topics for prompt injection."""
     return ", ".join(topics)
 
 
+@functools.lru_cache(maxsize=1024)
+def _build_system(template: str, topics: tuple[str, ...], **fields: str) -> str:
+    """Fill a system prompt template with the reader's topics (cached per user)."""
+    return template.format(user_topics=format_topics(topics), **fields)
+
+
 # =============================================================================
 # PER-SITE AGENT PROMPT
 # =============================================================================
@@ -139,39 +151,43 @@ Return JSON:
 
 def build_site_agent_prompt(source: str, user_topics: list[str], articles: list[dict]) -> tuple[str, str]:
     """Build system and user prompts for per-site agent."""
-    import json
-
-    system = SITE_AGENT_SYSTEM.format(
-        source=source,
-        user_topics=format_topics(user_topics)
-    )
+    system = _build_system(SITE_AGENT_SYSTEM, tuple(user_topics), source=source)
 
     user = SITE_AGENT_USER.format(
         source=source,
-        articles_json=json.dumps([
-            {"title": a.get("title", ""), "text": a.get("text", "")[:1500]}  # Truncate text
+        articles_json=_articles_json(tuple(
+            (a.get("title", ""), a.get("text", "")[:1500])  # Truncate text
             for a in articles
-        ], indent=2)
+        ))
     )
 
     return system, user
 
 
+@functools.lru_cache(maxsize=256)
+def _articles_json(articles: tuple[tuple[str, str], ...]) -> str:
+    """Serialize article (title, text) pairs, cached across users sharing a source."""
+    return orjson.dumps([
+        {"title": title, "text": text}
+        for title, text in articles
+    ], option=orjson.OPT_INDENT_2).decode()
+
+
 def build_landscape_prompt(user_topics: list[str], source_summaries: dict, total_articles: int) -> tuple[str, str]:
     """Build system and user prompts for landscape summary."""
-    system = LANDSCAPE_SYSTEM.format(user_topics=format_topics(user_topics))
+    system = _build_system(LANDSCAPE_SYSTEM, tuple(user_topics))
 
     # Format summaries by source
-    summaries_text = ""
+    parts: list[str] = []
     for source, articles in source_summaries.items():
-        summaries_text += f"\n## {source}\n"
+        parts.append(f"\n## {source}\n")
         for a in articles[:3]:  # Top 3 per source for landscape
-            summaries_text += f"- {a['title']}: {a['summary']}\n"
+            parts.append(f"- {a['title']}: {a['summary']}\n")
 
     user = LANDSCAPE_USER.format(
         num_sources=len(source_summaries),
         total_articles=total_articles,
-        summaries=summaries_text
+        summaries="".join(parts)
     )
 
     return system, user
@@ -179,16 +195,17 @@ def build_landscape_prompt(user_topics: list[str], source_summaries: dict, total
 
 def build_top5_prompt(user_topics: list[str], articles: list[dict]) -> tuple[str, str]:
     """Build system and user prompts for top 5 selection."""
-    system = TOP5_SYSTEM.format(user_topics=format_topics(user_topics))
+    system = _build_system(TOP5_SYSTEM, tuple(user_topics))
 
-    articles_text = "\n".join([
-        f"[{i+1}] {a['title']} (relevance: {a.get('relevance', 0.5):.2f})\n    {a['summary']}\n    URL: {a['url']}"
-        for i, a in enumerate(articles)
-    ])
+    parts: list[str] = []
+    for i, a in enumerate(articles, 1):
+        rel = a.get("relevance", 0.5)
+        url = a.get("url", "")
+        parts.append(f"[{i}] {a['title']} (relevance: {rel:.2f})\n    {a['summary']}\n    URL: {url}")
 
     user = TOP5_USER.format(
         num_articles=len(articles),
-        articles=articles_text
+        articles="\n".join(parts)
     )
 
     return system, user
@@ -196,17 +213,18 @@ def build_top5_prompt(user_topics: list[str], articles: list[dict]) -> tuple[str
 
 def build_deep_dive_prompt(user_topics: list[str], articles: list[dict]) -> tuple[str, str]:
     """Build system and user prompts for deep dive analysis."""
-    system = DEEP_DIVE_SYSTEM.format(user_topics=format_topics(user_topics))
+    system = _build_system(DEEP_DIVE_SYSTEM, tuple(user_topics))
 
     # Include URLs so the LLM can reference real articles
-    articles_text = "\n".join([
-        f"- {a['title']}: {a['summary']} (keywords: {', '.join(a.get('keywords', []))}) URL: {a.get('url', '')}"
-        for a in articles
-    ])
+    parts: list[str] = []
+    for a in articles:
+        kw = ", ".join(a.get("keywords", []) or ())
+        url = a.get("url", "")
+        parts.append(f"- {a['title']}: {a['summary']} (keywords: {kw}) URL: {url}")
 
     user = DEEP_DIVE_USER.format(
         num_articles=len(articles),
-        articles=articles_text
+        articles="\n".join(parts)
     )
 
     return system, user
@@ -76,11 +76,19 @@ async def check_services():
 async def preview_briefing():
     """Generate and preview a briefing without sending."""
     from node2_briefing_generator import BriefingGenerator, config
-    from datetime import datetime, timedelta
 
     print("\n📰 Generating briefing preview...\n")
 
     generator = BriefingGenerator(config)
+    try:
+        await _preview_with(generator)
+    finally:
+        await generator.close()
+
+
+async def _preview_with(generator):
+    """Run the preview pipeline with an existing generator."""
+    from datetime import datetime
 
     # Load user
     profiles = generator.profile_loader.load_profiles()
@@ -160,7 +168,10 @@ async def send_briefing():
     print("\n📧 Generating and sending briefings...\n")
 
     generator = BriefingGenerator(config)
-    results = await generator.run()
+    try:
+        results = await generator.run()
+    finally:
+        await generator.close()
 
     print("\n" + "=" * 50)
     print("RESULTS")